@@ -3,9 +3,24 @@
  * Security: binds to 127.0.0.1 only; optional BRIDGE_TOKEN auth.
  */
 
+import { timingSafeEqual } from 'crypto';
 import { WebSocketServer, WebSocket } from 'ws';
 import { WhatsAppClient, InboundMessage } from './whatsapp.js';
 
+// Commands carry chat text and file paths, never media bytes, so 1 MiB is ample.
+// ws drops larger frames before buffering them, which also bounds pre-auth memory.
+const MAX_PAYLOAD_BYTES = 1024 * 1024;
+
+// The auth handshake is a tiny JSON object; refuse anything larger before parsing it.
+const MAX_AUTH_MESSAGE_BYTES = 4096;
+
+function tokenMatches(candidate: unknown, expected: string): boolean {
+  if (typeof candidate !== 'string') return false;
+  const a = Buffer.from(candidate);
+  const b = Buffer.from(expected);
+  return a.length === b.length && timingSafeEqual(a, b);
+}
+
 interface SendCommand {
   type: 'send';
   to: string;
@@ -37,7 +52,7 @@ export class BridgeServer {
 
   async start(): Promise<void> {
     // Bind to localhost only — never expose to external network
-    this.wss = new WebSocketServer({ host: '127.0.0.1', port: this.port });
+    this.wss = new WebSocketServer({ host: '127.0.0.1', port: this.port, maxPayload: MAX_PAYLOAD_BYTES });
     console.log(`🌉 Bridge server listening on ws://127.0.0.1:${this.port}`);
     if (this.token) console.log('🔒 Token authentication enabled');
 
@@ -54,11 +69,16 @@ export class BridgeServer {
       if (this.token) {
         // Require auth handshake as first message
         const timeout = setTimeout(() => ws.close(4001, 'Auth timeout'), 5000);
-        ws.once('message', (data) => {
+        ws.once('message', (data, isBinary) => {
           clearTimeout(timeout);
+          const raw = data as Buffer;
+          if (isBinary || raw.length > MAX_AUTH_MESSAGE_BYTES) {
+            ws.close(4003, 'Invalid auth message');
+            return;
+          }
           try {
-            const msg = JSON.parse(data.toString());
-            if (msg.type === 'auth' && msg.token === this.token) {
+            const msg = JSON.parse(raw.toString());
+            if (msg.type === 'auth' && tokenMatches(msg.token, this.token!)) {
               console.log('🔗 Python client authenticated');
               this.setupClient(ws);
             } else {
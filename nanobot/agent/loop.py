@@ -7,6 +7,7 @@ import json
 import re
 import os
 import time
+import weakref
 from contextlib import AsyncExitStack, nullcontext
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Awaitable, Callable
@@ -212,10 +213,13 @@ class AgentLoop:
         self._mcp_servers = mcp_servers or {}
         self._mcp_stack: AsyncExitStack | None = None
         self._mcp_connected = False
-        self._mcp_connecting = False
+        # Pending connect attempt; concurrent callers wait on it instead of
+        # carrying on without the MCP tools.
+        self._mcp_connecting: asyncio.Future[None] | None = None
         self._active_tasks: dict[str, list[asyncio.Task]] = {}  # session_key -> tasks
         self._background_tasks: list[asyncio.Task] = []
-        self._session_locks: dict[str, asyncio.Lock] = {}
+        # Weak values: a session's lock lives only while a turn holds or awaits it.
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
         # NANOBOT_MAX_CONCURRENT_REQUESTS: <=0 means unlimited; default 3.
         _max = int(os.environ.get("NANOBOT_MAX_CONCURRENT_REQUESTS", "3"))
         self._concurrency_gate: asyncio.Semaphore | None = (
@@ -260,10 +264,13 @@ class AgentLoop:
 
     async def _connect_mcp(self) -> None:
         """Connect to configured MCP servers (one-time, lazy)."""
-        if self._mcp_connected or self._mcp_connecting or not self._mcp_servers:
+        if self._mcp_connected or not self._mcp_servers:
+            return
+        if self._mcp_connecting is not None:
+            await asyncio.shield(self._mcp_connecting)
             return
-        self._mcp_connecting = True
         from nanobot.agent.tools.mcp import connect_mcp_servers
+        self._mcp_connecting = asyncio.get_running_loop().create_future()
         try:
             self._mcp_stack = AsyncExitStack()
             await self._mcp_stack.__aenter__()
@@ -278,7 +285,8 @@ class AgentLoop:
                     pass
                 self._mcp_stack = None
         finally:
-            self._mcp_connecting = False
+            self._mcp_connecting.set_result(None)
+            self._mcp_connecting = None
 
     def _set_tool_context(self, channel: str, chat_id: str, message_id: str | None = None) -> None:
         """Update context for all tools that need routing info."""
@@ -389,7 +397,9 @@ class AgentLoop:
 
     async def _dispatch(self, msg: InboundMessage) -> None:
         """Process a message: per-session serial, cross-session concurrent."""
-        lock = self._session_locks.setdefault(msg.session_key, asyncio.Lock())
+        lock = self._session_locks.get(msg.session_key)
+        if lock is None:
+            lock = self._session_locks[msg.session_key] = asyncio.Lock()
         gate = self._concurrency_gate or nullcontext()
         async with lock, gate:
             try:
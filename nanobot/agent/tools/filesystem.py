@@ -1,7 +1,10 @@
 """File system tools: read, write, edit, list."""
 
+import asyncio
 import difflib
 import mimetypes
+import weakref
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +30,11 @@ def _resolve_path(
     return resolved
 
 
+# Serialises reads, writes and read-modify-write edits per file; concurrent
+# tool calls in one turn would otherwise overwrite each other's changes.
+_EDIT_LOCKS: weakref.WeakValueDictionary[Path, asyncio.Lock] = weakref.WeakValueDictionary()
+
+
 def _is_under(path: Path, directory: Path) -> bool:
     try:
         path.relative_to(directory.resolve())
@@ -103,7 +111,8 @@ class ReadFileTool(_FsTool):
             if not fp.is_file():
                 return f"Error: Not a file: {path}"
 
-            raw = fp.read_bytes()
+            async with _EDIT_LOCKS.setdefault(fp, asyncio.Lock()):
+                raw = await asyncio.to_thread(fp.read_bytes)
             if not raw:
                 return f"(Empty file: {path})"
 
@@ -183,8 +192,9 @@ class WriteFileTool(_FsTool):
             if content is None:
                 raise ValueError("Unknown content")
             fp = self._resolve(path)
-            fp.parent.mkdir(parents=True, exist_ok=True)
-            fp.write_text(content, encoding="utf-8")
+            async with _EDIT_LOCKS.setdefault(fp, asyncio.Lock()):
+                fp.parent.mkdir(parents=True, exist_ok=True)
+                await asyncio.to_thread(fp.write_text, content, encoding="utf-8")
             return f"Successfully wrote {len(content)} bytes to {fp}"
         except PermissionError as e:
             return f"Error: {e}"
@@ -202,8 +212,12 @@ def _find_match(content: str, old_text: str) -> tuple[str | None, int]:
     Both inputs should use LF line endings (caller normalises CRLF).
     Returns (matched_fragment, count) or (None, 0).
     """
-    if old_text in content:
-        return old_text, content.count(old_text)
+    idx = content.find(old_text)
+    if idx >= 0:
+        # One scan settles the common unique case; only count when ambiguous.
+        if content.find(old_text, idx + len(old_text)) < 0:
+            return old_text, 1
+        return old_text, content.count(old_text, idx)
 
     old_lines = old_text.splitlines()
     if not old_lines:
@@ -222,6 +236,47 @@ def _find_match(content: str, old_text: str) -> tuple[str | None, int]:
     return None, 0
 
 
+def _ratio_upper_bounds(old_lines: list[str], lines: list[str]) -> list[tuple[float, int]]:
+    """Cheap upper bound on SequenceMatcher.ratio() for every window start.
+
+    A matching block can only pair equal lines, so the number of matched
+    lines never exceeds the multiset overlap of the two windows.  The
+    overlap is maintained with a sliding Counter in O(1) per step.
+    Returns ``(bound, start)`` pairs, best bound first, then by position.
+    """
+    window = len(old_lines)
+    target = Counter(old_lines)
+    current: Counter[str] = Counter()
+    overlap = 0
+
+    def add(line: str) -> None:
+        nonlocal overlap
+        if current[line] < target[line]:
+            overlap += 1
+        current[line] += 1
+
+    def remove(line: str) -> None:
+        nonlocal overlap
+        current[line] -= 1
+        if current[line] < target[line]:
+            overlap -= 1
+
+    for line in lines[:window]:
+        add(line)
+
+    # Every window holds the same number of lines, so the denominator is fixed.
+    total = window + min(window, len(lines))
+    bounds: list[tuple[float, int]] = []
+    for i in range(max(1, len(lines) - window + 1)):
+        if i:
+            remove(lines[i - 1])
+            add(lines[i + window - 1])
+        bounds.append((2.0 * overlap / total if total else 1.0, i))
+
+    bounds.sort(key=lambda b: (-b[0], b[1]))
+    return bounds
+
+
 class EditFileTool(_FsTool):
     """Edit a file by replacing text with fallback matching."""
 
@@ -270,25 +325,26 @@ class EditFileTool(_FsTool):
             if not fp.exists():
                 return f"Error: File not found: {path}"
 
-            raw = fp.read_bytes()
-            uses_crlf = b"\r\n" in raw
-            content = raw.decode("utf-8").replace("\r\n", "\n")
-            match, count = _find_match(content, old_text.replace("\r\n", "\n"))
-
-            if match is None:
-                return self._not_found_msg(old_text, content, path)
-            if count > 1 and not replace_all:
-                return (
-                    f"Warning: old_text appears {count} times. "
-                    "Provide more context to make it unique, or set replace_all=true."
-                )
-
-            norm_new = new_text.replace("\r\n", "\n")
-            new_content = content.replace(match, norm_new) if replace_all else content.replace(match, norm_new, 1)
-            if uses_crlf:
-                new_content = new_content.replace("\n", "\r\n")
-
-            fp.write_bytes(new_content.encode("utf-8"))
+            async with _EDIT_LOCKS.setdefault(fp, asyncio.Lock()):
+                raw = await asyncio.to_thread(fp.read_bytes)
+                uses_crlf = b"\r\n" in raw
+                content = raw.decode("utf-8").replace("\r\n", "\n")
+                match, count = _find_match(content, old_text.replace("\r\n", "\n"))
+
+                if match is None:
+                    return self._not_found_msg(old_text, content, path)
+                if count > 1 and not replace_all:
+                    return (
+                        f"Warning: old_text appears {count} times. "
+                        "Provide more context to make it unique, or set replace_all=true."
+                    )
+
+                norm_new = new_text.replace("\r\n", "\n")
+                new_content = content.replace(match, norm_new) if replace_all else content.replace(match, norm_new, 1)
+                if uses_crlf:
+                    new_content = new_content.replace("\n", "\r\n")
+
+                await asyncio.to_thread(fp.write_bytes, new_content.encode("utf-8"))
             return f"Successfully edited {fp}"
         except PermissionError as e:
             return f"Error: {e}"
@@ -301,10 +357,14 @@ class EditFileTool(_FsTool):
         old_lines = old_text.splitlines(keepends=True)
         window = len(old_lines)
 
+        # Only windows whose upper bound can still beat the best ratio are
+        # scored with SequenceMatcher; the result matches a full scan.
         best_ratio, best_start = 0.0, 0
-        for i in range(max(1, len(lines) - window + 1)):
+        for bound, i in _ratio_upper_bounds(old_lines, lines):
+            if bound <= 0.5 or bound < best_ratio:
+                break
             ratio = difflib.SequenceMatcher(None, old_lines, lines[i : i + window]).ratio()
-            if ratio > best_ratio:
+            if ratio > best_ratio or (ratio == best_ratio and i < best_start):
                 best_ratio, best_start = ratio, i
 
         if best_ratio > 0.5:
@@ -377,25 +437,7 @@ class ListDirTool(_FsTool):
                 return f"Error: Not a directory: {path}"
 
             cap = max_entries or self._DEFAULT_MAX
-            items: list[str] = []
-            total = 0
-
-            if recursive:
-                for item in sorted(dp.rglob("*")):
-                    if any(p in self._IGNORE_DIRS for p in item.parts):
-                        continue
-                    total += 1
-                    if len(items) < cap:
-                        rel = item.relative_to(dp)
-                        items.append(f"{rel}/" if item.is_dir() else str(rel))
-            else:
-                for item in sorted(dp.iterdir()):
-                    if item.name in self._IGNORE_DIRS:
-                        continue
-                    total += 1
-                    if len(items) < cap:
-                        pfx = "📁 " if item.is_dir() else "📄 "
-                        items.append(f"{pfx}{item.name}")
+            items, total = await asyncio.to_thread(self._collect, dp, recursive, cap)
 
             if not items and total == 0:
                 return f"Directory {path} is empty"
@@ -408,3 +450,27 @@ class ListDirTool(_FsTool):
             return f"Error: {e}"
         except Exception as e:
             return f"Error listing directory: {e}"
+
+    def _collect(self, dp: Path, recursive: bool, cap: int) -> tuple[list[str], int]:
+        """Walk *dp* and return up to *cap* formatted entries plus the total count."""
+        items: list[str] = []
+        total = 0
+
+        if recursive:
+            for item in sorted(dp.rglob("*")):
+                if any(p in self._IGNORE_DIRS for p in item.parts):
+                    continue
+                total += 1
+                if len(items) < cap:
+                    rel = item.relative_to(dp)
+                    items.append(f"{rel}/" if item.is_dir() else str(rel))
+        else:
+            for item in sorted(dp.iterdir()):
+                if item.name in self._IGNORE_DIRS:
+                    continue
+                total += 1
+                if len(items) < cap:
+                    pfx = "📁 " if item.is_dir() else "📄 "
+                    items.append(f"{pfx}{item.name}")
+
+        return items, total
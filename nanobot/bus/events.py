@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """Message received from a chat channel."""
 
@@ -24,7 +24,7 @@ class InboundMessage:
         return self.session_key_override or f"{self.channel}:{self.chat_id}"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """Message to send to a chat channel."""
 
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from nanobot.bus.events import InboundMessage, OutboundMessage
 from nanobot.bus.queue import MessageBus
 
+if TYPE_CHECKING:
+    from nanobot.providers.transcription import GroqTranscriptionProvider
+
 
 class BaseChannel(ABC):
     """
@@ -23,6 +26,7 @@ class BaseChannel(ABC):
     name: str = "base"
     display_name: str = "Base"
     transcription_api_key: str = ""
+    _transcriber: GroqTranscriptionProvider | None = None
 
     def __init__(self, config: Any, bus: MessageBus):
         """
@@ -41,14 +45,21 @@ class BaseChannel(ABC):
         if not self.transcription_api_key:
             return ""
         try:
-            from nanobot.providers.transcription import GroqTranscriptionProvider
+            if self._transcriber is None:
+                from nanobot.providers.transcription import GroqTranscriptionProvider
 
-            provider = GroqTranscriptionProvider(api_key=self.transcription_api_key)
-            return await provider.transcribe(file_path)
+                self._transcriber = GroqTranscriptionProvider(api_key=self.transcription_api_key)
+            return await self._transcriber.transcribe(file_path)
         except Exception as e:
             logger.warning("{}: audio transcription failed: {}", self.name, e)
             return ""
 
+    async def close_transcriber(self) -> None:
+        """Release the transcription provider's pooled HTTP connections."""
+        if self._transcriber is not None:
+            await self._transcriber.aclose()
+            self._transcriber = None
+
     async def login(self, force: bool = False) -> bool:
         """
         Perform channel-specific interactive login (e.g. QR code scan).
@@ -106,13 +106,22 @@ class ChannelManager:
             except asyncio.CancelledError:
                 pass
 
-        # Stop all channels
-        for name, channel in self.channels.items():
-            try:
-                await channel.stop()
-                logger.info("Stopped {} channel", name)
-            except Exception as e:
-                logger.error("Error stopping {}: {}", name, e)
+        # Stop all channels concurrently so one slow shutdown doesn't delay the rest
+        await asyncio.gather(
+            *(self._stop_channel(name, channel) for name, channel in self.channels.items())
+        )
+
+    async def _stop_channel(self, name: str, channel: BaseChannel) -> None:
+        """Stop a channel and log any exceptions."""
+        try:
+            await channel.stop()
+            logger.info("Stopped {} channel", name)
+        except Exception as e:
+            logger.error("Error stopping {}: {}", name, e)
+        try:
+            await channel.close_transcriber()
+        except Exception as e:
+            logger.error("Error closing {} transcriber: {}", name, e)
 
     async def _dispatch_outbound(self) -> None:
         """Dispatch outbound messages to the appropriate channel."""
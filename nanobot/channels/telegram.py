@@ -7,6 +7,7 @@ import re
 import time
 import unicodedata
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Literal
 
 from loguru import logger
@@ -27,13 +28,27 @@ from nanobot.utils.helpers import split_message
 TELEGRAM_MAX_MESSAGE_LEN = 4000  # Telegram message character limit
 TELEGRAM_REPLY_CONTEXT_MAX_LEN = TELEGRAM_MAX_MESSAGE_LEN  # Max length for reply context in user message
 
+# Markdown patterns, compiled once at import time.
+_BOLD_STAR_RE = re.compile(r'\*\*(.+?)\*\*')
+_BOLD_UNDERSCORE_RE = re.compile(r'__(.+?)__')
+_STRIKE_RE = re.compile(r'~~(.+?)~~')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+_CODE_BLOCK_RE = re.compile(r'```[\w]*\n?([\s\S]*?)```')
+_TABLE_SEP_CELL_RE = re.compile(r'^:?-+:?$')
+_TABLE_ROW_RE = re.compile(r'^\s*\|.+\|')
+_HEADER_RE = re.compile(r'^#{1,6}\s+(.+)$', re.MULTILINE)
+_BLOCKQUOTE_RE = re.compile(r'^>\s*(.*)$', re.MULTILINE)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_ITALIC_RE = re.compile(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])')
+_BULLET_RE = re.compile(r'^[-*]\s+', re.MULTILINE)
+
 
 def _strip_md(s: str) -> str:
     """Strip markdown inline formatting from text."""
-    s = re.sub(r'\*\*(.+?)\*\*', r'\1', s)
-    s = re.sub(r'__(.+?)__', r'\1', s)
-    s = re.sub(r'~~(.+?)~~', r'\1', s)
-    s = re.sub(r'`([^`]+)`', r'\1', s)
+    s = _BOLD_STAR_RE.sub(r'\1', s)
+    s = _BOLD_UNDERSCORE_RE.sub(r'\1', s)
+    s = _STRIKE_RE.sub(r'\1', s)
+    s = _INLINE_CODE_RE.sub(r'\1', s)
     return s.strip()
 
 
@@ -47,7 +62,7 @@ def _render_table_box(table_lines: list[str]) -> str:
     has_sep = False
     for line in table_lines:
         cells = [_strip_md(c) for c in line.strip().strip('|').split('|')]
-        if all(re.match(r'^:?-+:?$', c) for c in cells if c):
+        if all(_TABLE_SEP_CELL_RE.match(c) for c in cells if c):
             has_sep = True
             continue
         rows.append(cells)
@@ -82,16 +97,16 @@ def _markdown_to_telegram_html(text: str) -> str:
         code_blocks.append(m.group(1))
         return f"\x00CB{len(code_blocks) - 1}\x00"
 
-    text = re.sub(r'```[\w]*\n?([\s\S]*?)```', save_code_block, text)
+    text = _CODE_BLOCK_RE.sub(save_code_block, text)
 
     # 1.5. Convert markdown tables to box-drawing (reuse code_block placeholders)
     lines = text.split('\n')
     rebuilt: list[str] = []
     li = 0
     while li < len(lines):
-        if re.match(r'^\s*\|.+\|', lines[li]):
+        if _TABLE_ROW_RE.match(lines[li]):
             tbl: list[str] = []
-            while li < len(lines) and re.match(r'^\s*\|.+\|', lines[li]):
+            while li < len(lines) and _TABLE_ROW_RE.match(lines[li]):
                 tbl.append(lines[li])
                 li += 1
             box = _render_table_box(tbl)
@@ -111,32 +126,32 @@ def _markdown_to_telegram_html(text: str) -> str:
         inline_codes.append(m.group(1))
         return f"\x00IC{len(inline_codes) - 1}\x00"
 
-    text = re.sub(r'`([^`]+)`', save_inline_code, text)
+    text = _INLINE_CODE_RE.sub(save_inline_code, text)
 
     # 3. Headers # Title -> just the title text
-    text = re.sub(r'^#{1,6}\s+(.+)$', r'\1', text, flags=re.MULTILINE)
+    text = _HEADER_RE.sub(r'\1', text)
 
     # 4. Blockquotes > text -> just the text (before HTML escaping)
-    text = re.sub(r'^>\s*(.*)$', r'\1', text, flags=re.MULTILINE)
+    text = _BLOCKQUOTE_RE.sub(r'\1', text)
 
     # 5. Escape HTML special characters
     text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
     # 6. Links [text](url) - must be before bold/italic to handle nested cases
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', text)
+    text = _LINK_RE.sub(r'<a href="\2">\1</a>', text)
 
     # 7. Bold **text** or __text__
-    text = re.sub(r'\*\*(.+?)\*\*', r'<b>\1</b>', text)
-    text = re.sub(r'__(.+?)__', r'<b>\1</b>', text)
+    text = _BOLD_STAR_RE.sub(r'<b>\1</b>', text)
+    text = _BOLD_UNDERSCORE_RE.sub(r'<b>\1</b>', text)
 
     # 8. Italic _text_ (avoid matching inside words like some_var_name)
-    text = re.sub(r'(?<![a-zA-Z0-9])_([^_]+)_(?![a-zA-Z0-9])', r'<i>\1</i>', text)
+    text = _ITALIC_RE.sub(r'<i>\1</i>', text)
 
     # 9. Strikethrough ~~text~~
-    text = re.sub(r'~~(.+?)~~', r'<s>\1</s>', text)
+    text = _STRIKE_RE.sub(r'<s>\1</s>', text)
 
     # 10. Bullet lists - item -> • item
-    text = re.sub(r'^[-*]\s+', '• ', text, flags=re.MULTILINE)
+    text = _BULLET_RE.sub('• ', text)
 
     # 11. Restore inline code with HTML tags
     for i, code in enumerate(inline_codes):
@@ -153,6 +168,12 @@ def _markdown_to_telegram_html(text: str) -> str:
     return text
 
 
+_EXT_BY_MIME = {
+    "image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif",
+    "audio/ogg": ".ogg", "audio/mpeg": ".mp3", "audio/mp4": ".m4a",
+}
+_EXT_BY_MEDIA_TYPE = {"image": ".jpg", "voice": ".ogg", "audio": ".mp3", "file": ""}
+
 _SEND_MAX_RETRIES = 3
 _SEND_RETRY_BASE_DELAY = 0.5  # seconds, doubled each retry
 
@@ -930,21 +951,13 @@ class TelegramChannel(BaseChannel):
         filename: str | None = None,
     ) -> str:
         """Get file extension based on media type or original filename."""
-        if mime_type:
-            ext_map = {
-                "image/jpeg": ".jpg", "image/png": ".png", "image/gif": ".gif",
-                "audio/ogg": ".ogg", "audio/mpeg": ".mp3", "audio/mp4": ".m4a",
-            }
-            if mime_type in ext_map:
-                return ext_map[mime_type]
-
-        type_map = {"image": ".jpg", "voice": ".ogg", "audio": ".mp3", "file": ""}
-        if ext := type_map.get(media_type, ""):
+        if mime_type and (ext := _EXT_BY_MIME.get(mime_type)):
             return ext
 
-        if filename:
-            from pathlib import Path
+        if ext := _EXT_BY_MEDIA_TYPE.get(media_type, ""):
+            return ext
 
+        if filename:
             return "".join(Path(filename).suffixes)
 
         return ""
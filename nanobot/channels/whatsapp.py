@@ -4,6 +4,7 @@ import asyncio
 import json
 import mimetypes
 import os
+import random
 import shutil
 import subprocess
 from collections import OrderedDict
@@ -18,6 +19,16 @@ from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
 from nanobot.config.schema import Base
 
+# Bridge reconnect backoff: 1s, 2s, 4s, ... capped at 30s, with +/-25% jitter.
+_RECONNECT_BASE_DELAY = 1.0
+_RECONNECT_MAX_DELAY = 30.0
+
+
+def _reconnect_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given reconnect attempt."""
+    delay = min(_RECONNECT_MAX_DELAY, _RECONNECT_BASE_DELAY * 2 ** min(attempt, 10))
+    return delay * random.uniform(0.75, 1.25)
+
 
 class WhatsAppConfig(Base):
     """WhatsApp channel configuration."""
@@ -92,6 +103,7 @@ class WhatsAppChannel(BaseChannel):
         logger.info("Connecting to WhatsApp bridge at {}...", bridge_url)
 
         self._running = True
+        attempts = 0
 
         while self._running:
             try:
@@ -107,6 +119,9 @@ class WhatsAppChannel(BaseChannel):
 
                     # Listen for messages
                     async for message in ws:
+                        # The bridge closes a rejected client before sending
+                        # anything, so the first frame means the link is healthy.
+                        attempts = 0
                         try:
                             await self._handle_bridge_message(message)
                         except Exception as e:
@@ -115,13 +130,15 @@ class WhatsAppChannel(BaseChannel):
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self._connected = False
-                self._ws = None
                 logger.warning("WhatsApp bridge connection error: {}", e)
 
-                if self._running:
-                    logger.info("Reconnecting in 5 seconds...")
-                    await asyncio.sleep(5)
+            self._connected = False
+            self._ws = None
+            if self._running:
+                delay = _reconnect_delay(attempts)
+                attempts += 1
+                logger.info("Reconnecting in {:.1f} seconds...", delay)
+                await asyncio.sleep(delay)
 
     async def stop(self) -> None:
         """Stop the WhatsApp channel."""
@@ -1,6 +1,8 @@
 """Configuration loading utilities."""
 
 import json
+import os
+import stat
 from pathlib import Path
 
 import pydantic
@@ -44,7 +46,7 @@ def load_config(config_path: Path | None = None) -> Config:
             data = _migrate_config(data)
             return Config.model_validate(data)
         except (json.JSONDecodeError, ValueError, pydantic.ValidationError) as e:
-            logger.warning(f"Failed to load config from {path}: {e}")
+            logger.warning("Failed to load config from {}: {}", path, e)
             logger.warning("Using default configuration.")
 
     return Config()
@@ -54,17 +56,32 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     """
     Save configuration to file.
 
+    The file is written to a temporary sibling and atomically moved into
+    place, so a crash mid-write never leaves a truncated config behind.
+    An existing file's permissions are kept; a new file is created 0600
+    since it holds API keys.
+
     Args:
         config: Configuration to save.
         config_path: Optional path to save to. Uses default if not provided.
     """
-    path = config_path or get_config_path()
+    # Resolve symlinks so the replace below updates the link's target.
+    path = (config_path or get_config_path()).resolve()
     path.parent.mkdir(parents=True, exist_ok=True)
 
     data = config.model_dump(mode="json", by_alias=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    mode = stat.S_IMODE(path.stat().st_mode) if path.exists() else 0o600
+    tmp_path = path.with_suffix(path.suffix + ".part")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _migrate_config(data: dict) -> dict:
@@ -346,10 +346,9 @@ PROVIDERS: tuple[ProviderSpec, ...] = (
 # ---------------------------------------------------------------------------
 
 
+_PROVIDERS_BY_NAME: dict[str, ProviderSpec] = {spec.name: spec for spec in PROVIDERS}
+
+
 def find_by_name(name: str) -> ProviderSpec | None:
     """Find a provider spec by config field name, e.g. "dashscope"."""
-    normalized = to_snake(name.replace("-", "_"))
-    for spec in PROVIDERS:
-        if spec.name == normalized:
-            return spec
-    return None
+    return _PROVIDERS_BY_NAME.get(to_snake(name.replace("-", "_")))
@@ -1,11 +1,19 @@
 """Voice transcription provider using Groq."""
 
+import asyncio
+import hashlib
 import os
+from collections import OrderedDict
 from pathlib import Path
+from typing import BinaryIO
 
 import httpx
 from loguru import logger
 
+_MODEL = "whisper-large-v3"
+_CACHE_MAX_ENTRIES = 512
+_MIN_AUDIO_BYTES = 256  # anything smaller cannot hold meaningful speech
+
 
 class GroqTranscriptionProvider:
     """
@@ -17,6 +25,29 @@ class GroqTranscriptionProvider:
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
         self.api_url = "https://api.groq.com/openai/v1/audio/transcriptions"
+        self._client: httpx.AsyncClient | None = None
+        # LRU of audio content digest -> transcript, so replayed voice
+        # messages are not uploaded and billed again.
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        # Uploads currently in progress, so a duplicate delivery of the same
+        # audio waits for the first request instead of issuing another.
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps the connection to Groq alive between
+        voice messages instead of paying a TCP + TLS handshake each time.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=60.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def transcribe(self, file_path: str | Path) -> str:
         """
@@ -33,32 +64,69 @@ class GroqTranscriptionProvider:
             return ""
 
         path = Path(file_path)
-        if not path.exists():
+        try:
+            f = open(path, "rb")  # noqa: SIM115
+        except FileNotFoundError:
             logger.error("Audio file not found: {}", file_path)
             return ""
+        except OSError as e:
+            logger.error("Groq transcription error: {}", e)
+            return ""
 
         try:
-            async with httpx.AsyncClient() as client:
-                with open(path, "rb") as f:
-                    files = {
-                        "file": (path.name, f),
-                        "model": (None, "whisper-large-v3"),
-                    }
-                    headers = {
-                        "Authorization": f"Bearer {self.api_key}",
-                    }
-
-                    response = await client.post(
-                        self.api_url,
-                        headers=headers,
-                        files=files,
-                        timeout=60.0
-                    )
-
-                    response.raise_for_status()
-                    data = response.json()
-                    return data.get("text", "")
+            client = self._get_client()
+            with f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _MIN_AUDIO_BYTES:
+                    logger.warning("Audio file too small to transcribe ({} bytes): {}", size, file_path)
+                    return ""
+
+                # Hashing reads the whole file; keep that off the event loop.
+                digest = await asyncio.to_thread(hashlib.file_digest, f, "blake2b")
+                key = f"{_MODEL}:{digest.hexdigest()}"
+                if (cached := self._cache.get(key)) is not None:
+                    self._cache.move_to_end(key)
+                    return cached
+                if (pending := self._inflight.get(key)) is not None:
+                    return await asyncio.shield(pending)
+
+                future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                text = ""
+                try:
+                    f.seek(0)
+                    text = await self._post(client, path.name, f)
+                finally:
+                    self._inflight.pop(key, None)
+                    future.set_result(text)
+
+                if text:
+                    self._cache[key] = text
+                    while len(self._cache) > _CACHE_MAX_ENTRIES:
+                        self._cache.popitem(last=False)
+                return text
 
         except Exception as e:
             logger.error("Groq transcription error: {}", e)
             return ""
+
+    async def _post(self, client: httpx.AsyncClient, filename: str, f: BinaryIO) -> str:
+        """Upload one audio file to Groq and return the transcript."""
+        files = {
+            "file": (filename, f),
+            "model": (None, _MODEL),
+        }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+        response = await client.post(
+            self.api_url,
+            headers=headers,
+            files=files,
+            timeout=60.0
+        )
+
+        response.raise_for_status()
+        data = response.json()
+        return data.get("text", "")
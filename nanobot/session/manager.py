@@ -158,8 +158,8 @@ class SessionManager:
         Returns:
             The session.
         """
-        if key in self._cache:
-            return self._cache[key]
+        if (session := self._cache.get(key)) is not None:
+            return session
 
         session = self._load(key)
         if session is None:
@@ -0,0 +1,48 @@
+import asyncio
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from nanobot.agent.loop import AgentLoop
+from nanobot.bus.queue import MessageBus
+
+
+def _make_loop(tmp_path: Path) -> AgentLoop:
+    provider = MagicMock()
+    provider.get_default_model.return_value = "test-model"
+    return AgentLoop(
+        bus=MessageBus(),
+        provider=provider,
+        workspace=tmp_path,
+        model="test-model",
+        mcp_servers={"demo": MagicMock()},
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_connect_mcp_waits_for_inflight_attempt(tmp_path: Path, monkeypatch) -> None:
+    loop = _make_loop(tmp_path)
+    release = asyncio.Event()
+    calls = 0
+
+    async def fake_connect(servers, registry, stack) -> None:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+
+    monkeypatch.setattr("nanobot.agent.tools.mcp.connect_mcp_servers", fake_connect)
+
+    first = asyncio.create_task(loop._connect_mcp())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(loop._connect_mcp())
+    await asyncio.sleep(0)
+
+    assert not second.done()
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert calls == 1
+    assert loop._mcp_connected
+    assert loop._mcp_connecting is None
+    await loop.close_mcp()
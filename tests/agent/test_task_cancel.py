@@ -176,6 +176,20 @@ class TestDispatch:
         await asyncio.gather(t1, t2)
         assert order == ["start-a", "end-a", "start-b", "end-b"]
 
+    @pytest.mark.asyncio
+    async def test_session_lock_released_after_dispatch(self):
+        import gc
+
+        from nanobot.bus.events import InboundMessage
+
+        loop, _bus = _make_loop()
+        loop._process_message = AsyncMock(return_value=None)
+
+        await loop._dispatch(InboundMessage(channel="test", sender_id="u1", chat_id="c1", content="a"))
+        gc.collect()
+
+        assert "test:c1" not in loop._session_locks
+
 
 class TestSubagentCancellation:
     @pytest.mark.asyncio
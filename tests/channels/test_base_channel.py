@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+import pytest
+
 from nanobot.bus.events import OutboundMessage
 from nanobot.bus.queue import MessageBus
 from nanobot.channels.base import BaseChannel
@@ -23,3 +25,32 @@ def test_is_allowed_requires_exact_match() -> None:
 
     assert channel.is_allowed("allow@email.com") is True
     assert channel.is_allowed("attacker|allow@email.com") is False
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_reuses_provider(monkeypatch) -> None:
+    created: list = []
+
+    class _FakeProvider:
+        def __init__(self, api_key: str | None = None):
+            self.closed = False
+            created.append(self)
+
+        async def transcribe(self, file_path) -> str:
+            return f"text:{file_path}"
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(
+        "nanobot.providers.transcription.GroqTranscriptionProvider", _FakeProvider
+    )
+    channel = _DummyChannel(SimpleNamespace(allow_from=["*"]), MessageBus())
+    channel.transcription_api_key = "key"
+
+    assert await channel.transcribe_audio("a.ogg") == "text:a.ogg"
+    assert await channel.transcribe_audio("b.ogg") == "text:b.ogg"
+    assert len(created) == 1
+
+    await channel.close_transcriber()
+    assert created[0].closed is True
@@ -756,6 +756,71 @@ async def test_stop_all_cancels_dispatcher_and_stops_channels():
     assert ch.stopped is True
 
 
+@pytest.mark.asyncio
+async def test_stop_all_stops_channels_concurrently():
+    """stop_all should not wait for one slow channel before stopping the next."""
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    class _SlowStopChannel(_StartableChannel):
+        async def stop(self) -> None:
+            started.set()
+            await release.wait()
+            await super().stop()
+
+    class _WaitingStopChannel(_StartableChannel):
+        async def stop(self) -> None:
+            await started.wait()
+            release.set()
+            await super().stop()
+
+    fake_config = SimpleNamespace(
+        channels=ChannelsConfig(),
+        providers=SimpleNamespace(groq=SimpleNamespace(api_key="")),
+    )
+
+    mgr = ChannelManager.__new__(ChannelManager)
+    mgr.config = fake_config
+    mgr.bus = MessageBus()
+    slow = _SlowStopChannel(fake_config, mgr.bus)
+    waiting = _WaitingStopChannel(fake_config, mgr.bus)
+    mgr.channels = {"slow": slow, "waiting": waiting}
+    mgr._dispatch_task = None
+
+    await asyncio.wait_for(mgr.stop_all(), timeout=1)
+
+    assert slow.stopped is True
+    assert waiting.stopped is True
+
+
+@pytest.mark.asyncio
+async def test_stop_all_closes_transcriber_when_stop_fails():
+    """A channel whose stop() raises must still release its transcriber client."""
+    closed: list[bool] = []
+
+    class _BrokenStopChannel(_StartableChannel):
+        async def stop(self) -> None:
+            raise RuntimeError("stop failed")
+
+        async def close_transcriber(self) -> None:
+            closed.append(True)
+
+    fake_config = SimpleNamespace(
+        channels=ChannelsConfig(),
+        providers=SimpleNamespace(groq=SimpleNamespace(api_key="")),
+    )
+
+    mgr = ChannelManager.__new__(ChannelManager)
+    mgr.config = fake_config
+    mgr.bus = MessageBus()
+    mgr.channels = {"broken": _BrokenStopChannel(fake_config, mgr.bus)}
+    mgr._dispatch_task = None
+
+    await mgr.stop_all()
+
+    assert closed == [True]
+
+
 @pytest.mark.asyncio
 async def test_start_channel_logs_error_on_failure():
     """_start_channel should log error when channel start fails."""
@@ -155,3 +155,60 @@ async def test_group_policy_mention_accepts_mentioned_group_message():
     kwargs = ch._handle_message.await_args.kwargs
     assert kwargs["chat_id"] == "12345@g.us"
     assert kwargs["sender_id"] == "user"
+
+
+@pytest.mark.asyncio
+async def test_reconnect_backs_off_exponentially(monkeypatch):
+    import websockets
+
+    ch = WhatsAppChannel({"enabled": True}, MagicMock())
+    delays: list[float] = []
+
+    def _refuse(*args, **kwargs):
+        raise OSError("bridge down")
+
+    async def _record_sleep(delay: float) -> None:
+        delays.append(delay)
+        if len(delays) == 8:
+            ch._running = False
+
+    monkeypatch.setattr(websockets, "connect", _refuse)
+    monkeypatch.setattr("nanobot.channels.whatsapp.asyncio.sleep", _record_sleep)
+    monkeypatch.setattr("nanobot.channels.whatsapp.random.uniform", lambda a, b: 1.0)
+
+    await ch.start()
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0, 30.0]
+
+    # A bridge that accepts the socket and then drops it (e.g. a rejected
+    # token) must keep backing off; only a frame from the bridge resets it.
+    class _FakeBridge:
+        def __init__(self, frames: list[str]) -> None:
+            self.frames = frames
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc) -> bool:
+            return False
+
+        async def send(self, data: str) -> None:
+            pass
+
+        async def __aiter__(self):
+            for frame in self.frames:
+                yield frame
+
+    connects = 0
+
+    def _accept_then_close(*args, **kwargs):
+        nonlocal connects
+        connects += 1
+        frames = ['{"type": "status", "status": "connected"}'] if connects == 4 else []
+        return _FakeBridge(frames)
+
+    delays.clear()
+    monkeypatch.setattr(websockets, "connect", _accept_then_close)
+    await ch.start()
+
+    assert delays[:6] == [1.0, 2.0, 4.0, 1.0, 2.0, 4.0]
@@ -0,0 +1,51 @@
+import json
+import stat
+import sys
+
+import pytest
+
+from nanobot.config import loader
+from nanobot.config.loader import save_config
+from nanobot.config.schema import Config
+
+
+def test_save_config_failure_keeps_previous_file(tmp_path, monkeypatch) -> None:
+    config_path = tmp_path / "config.json"
+    save_config(Config(), config_path)
+    before = config_path.read_text(encoding="utf-8")
+
+    def _boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(loader.json, "dump", _boom)
+    with pytest.raises(OSError):
+        save_config(Config(), config_path)
+
+    assert config_path.read_text(encoding="utf-8") == before
+    assert json.loads(before)
+    assert list(tmp_path.iterdir()) == [config_path]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_save_config_preserves_file_mode(tmp_path) -> None:
+    config_path = tmp_path / "config.json"
+    save_config(Config(), config_path)
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o600
+
+    config_path.chmod(0o640)
+    save_config(Config(), config_path)
+    assert stat.S_IMODE(config_path.stat().st_mode) == 0o640
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges")
+def test_save_config_writes_through_symlink(tmp_path) -> None:
+    target = tmp_path / "dotfiles" / "config.json"
+    target.parent.mkdir()
+    target.write_text("{}", encoding="utf-8")
+    link = tmp_path / "config.json"
+    link.symlink_to(target)
+
+    save_config(Config(), link)
+
+    assert link.is_symlink()
+    assert json.loads(target.read_text(encoding="utf-8"))
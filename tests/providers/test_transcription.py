@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+
+from nanobot.providers.transcription import GroqTranscriptionProvider
+
+
+def _provider_with_transport(handler) -> GroqTranscriptionProvider:
+    provider = GroqTranscriptionProvider(api_key="test-key")
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_transcribe_reuses_http_client(tmp_path) -> None:
+    audio = tmp_path / "voice.ogg"
+    audio.write_bytes(b"OggS" + b"\x00" * 1024)
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"text": "hello"})
+
+    provider = _provider_with_transport(handler)
+    client = provider._client
+
+    assert await provider.transcribe(audio) == "hello"
+    assert await provider.transcribe(audio) == "hello"
+
+    assert provider._client is client
+    assert len(calls) == 1  # second call served from the content-hash cache
+    assert calls[0].headers["Authorization"] == "Bearer test-key"
+
+    await provider.aclose()
+    assert client.is_closed
+    assert provider._client is None
+
+
+@pytest.mark.asyncio
+async def test_transcribe_cache_is_keyed_by_content(tmp_path) -> None:
+    first = tmp_path / "a.ogg"
+    second = tmp_path / "b.ogg"
+    other = tmp_path / "c.ogg"
+    first.write_bytes(b"OggS-one" * 64)
+    second.write_bytes(b"OggS-one" * 64)
+    other.write_bytes(b"OggS-two" * 64)
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"text": f"text-{len(calls)}"})
+
+    provider = _provider_with_transport(handler)
+
+    assert await provider.transcribe(first) == "text-1"
+    assert await provider.transcribe(second) == "text-1"
+    assert await provider.transcribe(other) == "text-2"
+    assert len(calls) == 2
+
+    await provider.aclose()
+
+
+class _WatchedInflight(dict):
+    """Records lookups that found an upload already in progress."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.joined = 0
+
+    def get(self, key, default=None):
+        value = super().get(key, default)
+        if value is not None:
+            self.joined += 1
+        return value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_transcribe_of_same_audio_shares_one_request(tmp_path) -> None:
+    first = tmp_path / "a.ogg"
+    second = tmp_path / "b.ogg"
+    first.write_bytes(b"OggS-same" * 64)
+    second.write_bytes(b"OggS-same" * 64)
+    release = asyncio.Event()
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        await release.wait()
+        return httpx.Response(200, json={"text": "shared"})
+
+    provider = _provider_with_transport(handler)
+    provider._inflight = inflight = _WatchedInflight()
+
+    tasks = [
+        asyncio.create_task(provider.transcribe(first)),
+        asyncio.create_task(provider.transcribe(second)),
+    ]
+    async with asyncio.timeout(5):
+        while not (calls and inflight.joined):
+            await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ["shared", "shared"]
+    assert len(calls) == 1
+    assert inflight == {}
+
+    await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_missing_or_tiny_file_returns_empty(tmp_path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    provider = _provider_with_transport(handler)
+
+    assert await provider.transcribe(tmp_path / "missing.ogg") == ""
+
+    tiny = tmp_path / "tiny.ogg"
+    tiny.write_bytes(b"OggS")
+    assert await provider.transcribe(tiny) == ""
+    assert await provider.transcribe(tmp_path) == ""  # unreadable: a directory
+
+    await provider.aclose()
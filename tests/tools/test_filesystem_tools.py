@@ -1,11 +1,14 @@
 """Tests for enhanced filesystem tools: ReadFileTool, EditFileTool, ListDirTool."""
 
+import asyncio
+
 import pytest
 
 from nanobot.agent.tools.filesystem import (
     EditFileTool,
     ListDirTool,
     ReadFileTool,
+    WriteFileTool,
     _find_match,
 )
 
@@ -205,6 +208,19 @@ class TestEditFileTool:
         assert "Error" in result
         assert "not found" in result
 
+    @pytest.mark.asyncio
+    async def test_not_found_reports_earliest_best_match(self, tool, tmp_path):
+        f = tmp_path / "near.py"
+        body = "".join(f"x{i} = {i}\n" for i in range(50))
+        block = "def foo():\n    a = 1\n    b = 2\n    return a + b\n"
+        f.write_text(body + block + body + block, encoding="utf-8")
+        result = await tool.execute(
+            path=str(f),
+            old_text="def foo():\n    a = 1\n    b = 3\n    return a + b\n",
+            new_text="pass",
+        )
+        assert "Best match (75% similar) at line 51" in result
+
     @pytest.mark.asyncio
     async def test_missing_new_text_returns_clear_error(self, tool, tmp_path):
         f = tmp_path / "a.py"
@@ -212,6 +228,30 @@ class TestEditFileTool:
         result = await tool.execute(path=str(f), old_text="hello")
         assert result == "Error editing file: Unknown new_text"
 
+    @pytest.mark.asyncio
+    async def test_concurrent_edits_to_same_file_both_apply(self, tool, tmp_path):
+        f = tmp_path / "vars.py"
+        f.write_text("A = 1\nB = 2\n", encoding="utf-8")
+        results = await asyncio.gather(
+            tool.execute(path=str(f), old_text="A = 1", new_text="A = 10"),
+            tool.execute(path=str(f), old_text="B = 2", new_text="B = 20"),
+        )
+        assert all("Successfully" in r for r in results)
+        assert f.read_text() == "A = 10\nB = 20\n"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_edit_and_write_keeps_later_write(self, tool, tmp_path):
+        f = tmp_path / "vars.py"
+        writer = WriteFileTool(workspace=tmp_path)
+        for _ in range(20):
+            f.write_text("A = 1\n", encoding="utf-8")
+            results = await asyncio.gather(
+                tool.execute(path=str(f), old_text="A = 1", new_text="A = 2"),
+                writer.execute(path=str(f), content="B = 9"),
+            )
+            assert all("Successfully" in r for r in results)
+            assert f.read_text() == "B = 9"
+
 
 # ---------------------------------------------------------------------------
 # ListDirTool
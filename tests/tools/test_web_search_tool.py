@@ -3,7 +3,7 @@
 import httpx
 import pytest
 
-from nanobot.agent.tools.web import WebSearchTool
+from nanobot.agent.tools.web import WebSearchTool, _strip_tags
 from nanobot.config.schema import WebSearchConfig
 
 
@@ -160,3 +160,16 @@ async def test_searxng_invalid_url():
     tool = _tool(provider="searxng", base_url="not-a-url")
     result = await tool.execute(query="test")
     assert "Error" in result
+
+
+def test_strip_tags_drops_script_style_and_markup():
+    raw = (
+        "<p>Hello <b>world</b></p><SCRIPT>alert('<b>x</b>')</SCRIPT>"
+        "<style>p { color: red; }</style> &amp; bye"
+    )
+    assert _strip_tags(raw) == "Hello world & bye"
+
+
+def test_strip_tags_drops_script_after_stray_angle_bracket():
+    raw = "if a < b <script>var x = 1 > 0; steal()</script> end"
+    assert _strip_tags(raw) == "if a < b  end"